@@ -27,58 +27,52 @@ fig.add_trace(go.Scatter(
 ))
 
 # Add rectangular shapes for each component
-shapes = []
-annotations = []
-
-for i, comp in enumerate(components):
-    # Add rectangle shape
-    shapes.append(dict(
+shapes = [
+    dict(
         type="rect",
         x0=comp["x"]-0.3, y0=comp["y"]-0.15,
         x1=comp["x"]+0.3, y1=comp["y"]+0.15,
         fillcolor=colors[i],
         line=dict(color="white", width=2),
         opacity=0.8
-    ))
-    
-    # Add main label
-    annotations.append(dict(
-        x=comp["x"], y=comp["y"]+0.05,
-        text=f"<b>{comp['name']}</b>",
+    )
+    for i, comp in enumerate(components)
+]
+
+# Add one label per component: bold name with the tech stack underneath
+annotations = [
+    dict(
+        x=comp["x"], y=comp["y"],
+        text=f"<b>{comp['name']}</b><br><span style='font-size:10px'>{comp['tech']}</span>",
         showarrow=False,
         font=dict(color="white", size=12),
         xanchor="center", yanchor="middle"
-    ))
-    
-    # Add tech label
-    annotations.append(dict(
-        x=comp["x"], y=comp["y"]-0.05,
-        text=comp["tech"],
-        showarrow=False,
-        font=dict(color="white", size=10),
-        xanchor="center", yanchor="middle"
-    ))
+    )
+    for comp in components
+]
 
 # Add arrows between components
-for i in range(len(components)-1):
-    current_y = components[i]["y"]
-    next_y = components[i+1]["y"]
-    
-    shapes.append(dict(
+shapes += [
+    dict(
         type="line",
-        x0=1, y0=current_y-0.15,
-        x1=1, y1=next_y+0.15,
+        x0=1, y0=current["y"]-0.15,
+        x1=1, y1=following["y"]+0.15,
         line=dict(color="#333333", width=3),
-    ))
-    
-    # Add arrowhead
-    annotations.append(dict(
-        x=1, y=next_y+0.18,
+    )
+    for current, following in zip(components, components[1:])
+]
+
+# Add arrowheads
+annotations += [
+    dict(
+        x=1, y=following["y"]+0.18,
         text="▼",
         showarrow=False,
         font=dict(color="#333333", size=14),
         xanchor="center", yanchor="middle"
-    ))
+    )
+    for following in components[1:]
+]
 
 fig.update_layout(
     title="Vahan Dashboard Architecture",
@@ -100,5 +94,6 @@ fig.update_layout(
     showlegend=False
 )
 
-# Save the chart
-fig.write_image("vahan_architecture_flow.png")
\ No newline at end of file
+# Save the chart when run on its own (export_charts.py renders both images in one go)
+if __name__ == "__main__":
+    fig.write_image("vahan_architecture_flow.png")
@@ -19,36 +19,33 @@ fig = go.Figure()
 # Add traces using the specified brand colors
 colors = ['#1FB8CD', '#DB4545', '#2E8B57']
 
-fig.add_trace(go.Scatter(
+fig.add_trace(go.Scattergl(
     x=months,
     y=data_2w_abbrev,
     mode='lines+markers',
     name='2W',
     line=dict(color=colors[0], width=3),
     marker=dict(size=6),
-    cliponaxis=False,
     hovertemplate='<b>%{fullData.name}</b><br>Month: %{x}<br>Registrations: %{y}k<extra></extra>'
 ))
 
-fig.add_trace(go.Scatter(
+fig.add_trace(go.Scattergl(
     x=months,
     y=data_3w_abbrev,
     mode='lines+markers',
     name='3W',
     line=dict(color=colors[1], width=3),
     marker=dict(size=6),
-    cliponaxis=False,
     hovertemplate='<b>%{fullData.name}</b><br>Month: %{x}<br>Registrations: %{y}k<extra></extra>'
 ))
 
-fig.add_trace(go.Scatter(
+fig.add_trace(go.Scattergl(
     x=months,
     y=data_4w_abbrev,
     mode='lines+markers',
     name='4W',
     line=dict(color=colors[2], width=3),
     marker=dict(size=6),
-    cliponaxis=False,
     hovertemplate='<b>%{fullData.name}</b><br>Month: %{x}<br>Registrations: %{y}k<extra></extra>'
 ))
 
@@ -66,5 +63,6 @@ fig.update_layout(
     )
 )
 
-# Save the chart
-fig.write_image('vahan_dashboard_preview.png')
\ No newline at end of file
+# Save the chart when run on its own (export_charts.py renders both images in one go)
+if __name__ == "__main__":
+    fig.write_image('vahan_dashboard_preview.png')
@@ -1,22 +1,114 @@
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+import pyarrow.dataset as ds
 import logging
+import copy
+from collections import OrderedDict
+from functools import lru_cache, wraps
 from typing import Dict, List, Tuple, Optional
-import requests
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+
+try:
+    import polars as pl
+except ImportError:  # Polars is optional; growth metrics fall back to pandas
+    pl = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; used for growth metrics without Polars
+    njit = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Most recently used analytics results kept per processor
+_ANALYSIS_CACHE_SIZE = 16
+
+def _memoize(cache: OrderedDict, key, compute):
+    """
+    Look a key up in a bounded LRU cache, computing and storing it on a miss
+
+    Args:
+        cache (OrderedDict): Cache ordered from least to most recently used
+        key: Cache key
+        compute: Zero-argument callable producing the value
+
+    Returns:
+        The cached value
+    """
+    if key in cache:
+        cache.move_to_end(key)
+    else:
+        cache[key] = compute()
+        if len(cache) > _ANALYSIS_CACHE_SIZE:
+            cache.popitem(last=False)
+    return cache[key]
+
+def _cached_on_data_version(method):
+    """
+    Memoize an analytics method on the processor's data version
+
+    Calls that pass an explicit DataFrame bypass the cache, since frames are
+    not hashable; list arguments are converted to tuples for the cache key.
+    Callers get a deep copy, so modifying a result never alters the cache
+    """
+    def hashable(value):
+        return tuple(value) if isinstance(value, list) else value
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if any(isinstance(value, pd.DataFrame) for value in (*args, *kwargs.values())):
+            return method(self, *args, **kwargs)
+
+        key = (
+            method.__name__,
+            self._data_version,
+            tuple(hashable(value) for value in args),
+            tuple(sorted((name, hashable(value)) for name, value in kwargs.items()))
+        )
+        result = _memoize(self._analysis_cache, key, lambda: method(self, *args, **kwargs))
+        return copy.deepcopy(result)
+
+    return wrapper
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _growth_kernel(values, starts, ends, yoy, qoq, ma_3m, ma_6m, ma_12m):
+        """
+        Fused YoY/QoQ/rolling-mean pass over date-sorted series
+
+        Each series occupies values[starts[g]:ends[g]]; series are processed
+        in parallel, each in one linear pass with running window sums
+        """
+        for g in prange(len(starts)):
+            start, end = starts[g], ends[g]
+            sum_3 = sum_6 = sum_12 = 0.0
+
+            for i in range(start, end):
+                pos = i - start
+                value = values[i]
+
+                sum_3 += value
+                sum_6 += value
+                sum_12 += value
+                if pos >= 3:
+                    sum_3 -= values[i - 3]
+                if pos >= 6:
+                    sum_6 -= values[i - 6]
+                if pos >= 12:
+                    sum_12 -= values[i - 12]
+
+                ma_3m[i] = sum_3 / 3 if pos >= 2 else np.nan
+                ma_6m[i] = sum_6 / 6 if pos >= 5 else np.nan
+                ma_12m[i] = sum_12 / 12 if pos >= 11 else np.nan
+
+                qoq[i] = (value / values[i - 3] - 1.0) * 100 if pos >= 3 else np.nan
+
+                yoy[i] = np.nan
+                if pos >= 12 and values[i - 12] > 0:
+                    yoy[i] = (value - values[i - 12]) / values[i - 12] * 100
+
 class VahanDataProcessor:
     """
     Comprehensive data processor for Vahan Dashboard data
@@ -32,21 +124,56 @@ class VahanDataProcessor:
         """
         self.data_source = data_source
         self.raw_data = None
+        self._data_version = 0
+        self._analysis_cache = OrderedDict()
         self.processed_data = None
 
-    def load_sample_data(self, filepath: str = 'vahan_sample_data.csv') -> pd.DataFrame:
+    @property
+    def processed_data(self) -> Optional[pd.DataFrame]:
+        """Processed data that the analytics methods default to"""
+        return self._processed_data
+
+    @processed_data.setter
+    def processed_data(self, df: Optional[pd.DataFrame]):
+        # New data invalidates every memoized analytics result
+        self._processed_data = df
+        self._data_version += 1
+        self._analysis_cache.clear()
+
+    def load_sample_data(self, filepath: str = 'vahan_sample_data.parquet',
+                         filters: Optional[ds.Expression] = None,
+                         columns: List[str] = None) -> pd.DataFrame:
         """
         Load sample data for development and testing
 
         Args:
-            filepath (str): Path to sample data CSV
+            filepath (str): Path to sample data Parquet (or CSV) file
+            filters (ds.Expression): Row filter pushed down to the Parquet scan
+            columns (List[str]): Columns to read from Parquet (all if None)
 
         Returns:
             pd.DataFrame: Loaded sample data
         """
         try:
-            df = pd.read_csv(filepath)
-            df['date'] = pd.to_datetime(df['date'])
+            if filepath.endswith('.parquet'):
+                # Parquet keeps the datetime, categorical and integer dtypes.
+                # Scanning through a pyarrow dataset prunes columns and skips
+                # row groups that cannot match the filter before decoding them
+                dataset = ds.dataset(filepath, format='parquet')
+                df = dataset.to_table(filter=filters, columns=columns).to_pandas()
+            else:
+                try:
+                    # The pyarrow engine parses the CSV with multiple threads
+                    df = pd.read_csv(filepath, engine='pyarrow')
+                except (ImportError, ValueError):
+                    df = pd.read_csv(filepath)
+                df['date'] = pd.to_datetime(df['date'])
+
+                # Dictionary-encode the repeated labels, as the Parquet file does
+                for column in ['month_name', 'state', 'vehicle_category', 'vehicle_class',
+                               'manufacturer', 'quarter', 'financial_year']:
+                    if column in df:
+                        df[column] = df[column].astype('category')
             logger.info(f"Loaded {len(df)} records from {filepath}")
             self.raw_data = df
             return df
@@ -69,7 +196,9 @@ class VahanDataProcessor:
         """
         # NOTE: This is a placeholder implementation
         # In production, you would implement actual web scraping logic
-        # using Selenium to navigate the Vahan dashboard
+        # using Selenium to navigate the Vahan dashboard (see vahan_scraper.py,
+        # a separate standalone script; this module does not import it, so
+        # the dashboard never loads Selenium)
 
         logger.warning("Web scraping not implemented in this demo version")
         logger.info("Using sample data instead")
@@ -77,72 +206,163 @@ class VahanDataProcessor:
         # For demo purposes, return sample data
         return self.load_sample_data()
 
-    def clean_and_process_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def clean_and_process_data(self, df: pd.DataFrame, use_polars: bool = True) -> pd.DataFrame:
         """
         Clean and process raw Vahan data
 
         Args:
             df (pd.DataFrame): Raw data
+            use_polars (bool): Compute growth metrics with Polars when it is installed
 
         Returns:
             pd.DataFrame: Cleaned and processed data
         """
         logger.info("Starting data cleaning and processing...")
 
-        # Create a copy to avoid modifying original
-        processed_df = df.copy()
-
-        # Data cleaning steps
-        processed_df = processed_df.dropna(subset=['registration_count'])
-        processed_df = processed_df[processed_df['registration_count'] > 0]
-
-        # Standardize manufacturer names
-        processed_df['manufacturer_clean'] = processed_df['manufacturer'].str.upper().str.strip()
+        # Data cleaning steps: a single boolean slice drops missing and
+        # non-positive counts; the explicit copy makes the result independent
+        # of df, so the column assignments below never write through to the
+        # caller's frame (or trip SettingWithCopyWarning on pandas 2.x).
+        # notna() keeps the mask a plain bool even for nullable integer counts
+        counts = df['registration_count']
+        processed_df = df.loc[counts.notna() & (counts > 0)].copy()
+
+        # Counts fit comfortably in int32 once missing values are gone
+        processed_df['registration_count'] = processed_df['registration_count'].astype(np.int32)
+
+        # Standardize manufacturer names once per distinct name rather than
+        # per row; a categorical column maps its categories and keeps the codes
+        manufacturer = processed_df['manufacturer']
+        if isinstance(manufacturer.dtype, pd.CategoricalDtype):
+            processed_df['manufacturer_clean'] = manufacturer.map(
+                lambda name: name.upper().strip(), na_action='ignore'
+            )
+        else:
+            clean_names = {
+                name: name.upper().strip()
+                for name in manufacturer.unique() if isinstance(name, str)
+            }
+            processed_df['manufacturer_clean'] = manufacturer.map(clean_names)
 
         # Add time-based features
-        processed_df['year_month'] = processed_df['date'].dt.to_period('M')
+        # year_month is an int32 month ordinal (months since 1970-01, the same
+        # numbering pandas uses for monthly Periods), so grouping on it is an
+        # integer groupby; year_month_labels turns it back into 'YYYY-MM'
+        dates = processed_df['date'].dt
+        processed_df['year_month'] = ((dates.year - 1970) * 12 + dates.month - 1).astype(np.int32)
         processed_df['day_of_year'] = processed_df['date'].dt.dayofyear
 
         # Calculate moving averages and trends
-        processed_df = self._calculate_growth_metrics(processed_df)
+        processed_df = self._calculate_growth_metrics(processed_df, use_polars)
+
+        # Growth rates and averages don't need double precision; float32 halves
+        # the bytes every later filter and aggregation has to scan
+        growth_cols = ['yoy_growth', 'qoq_growth', 'ma_3m', 'ma_6m', 'ma_12m']
+        processed_df[growth_cols] = processed_df[growth_cols].astype(np.float32)
 
         logger.info(f"Data processing complete. {len(processed_df)} records processed.")
         self.processed_data = processed_df
         return processed_df
 
-    def _calculate_growth_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_growth_metrics(self, df: pd.DataFrame, use_polars: bool = False) -> pd.DataFrame:
         """
         Calculate YoY and QoQ growth metrics
 
         Args:
             df (pd.DataFrame): Input data
+            use_polars (bool): Use Polars window expressions when available
 
         Returns:
             pd.DataFrame: Data with growth metrics
         """
-        result_records = []
+        # Each state x category x class x manufacturer combination is one monthly series
+        series_cols = ['state', 'vehicle_category', 'vehicle_class', 'manufacturer']
+        df = df.sort_values(series_cols + ['date'], kind='stable', ignore_index=True)
+
+        if use_polars and pl is not None:
+            return self._calculate_growth_metrics_polars(df, series_cols)
+
+        series = df.groupby(series_cols, observed=True, sort=False)
+
+        if njit is not None:
+            return self._calculate_growth_metrics_numba(df, series.ngroup().to_numpy())
+
+        # Calculate YoY growth against the same series 12 months earlier
+        prev_year = series['registration_count'].shift(12)
+        df['yoy_growth'] = np.where(
+            prev_year > 0,
+            (df['registration_count'] - prev_year) / prev_year * 100,
+            np.nan
+        )
+
+        # Calculate QoQ growth (3-month periods)
+        df['qoq_growth'] = series['registration_count'].pct_change(periods=3) * 100
+
+        # Calculate rolling averages within each series
+        for window in (3, 6, 12):
+            df[f'ma_{window}m'] = (
+                series['registration_count'].rolling(window=window).mean()
+                .reset_index(level=series_cols, drop=True)
+            )
+
+        return df
+
+    def _calculate_growth_metrics_numba(self, df: pd.DataFrame, group_ids: np.ndarray) -> pd.DataFrame:
+        """
+        Calculate growth metrics with the compiled Numba kernel
 
-        # Group by relevant dimensions for growth calculation
-        grouping_cols = ['state', 'vehicle_category', 'manufacturer']
+        Args:
+            df (pd.DataFrame): Input data sorted by series and date
+            group_ids (np.ndarray): Series number of every row, non-decreasing
 
-        for group_key, group_df in df.groupby(grouping_cols):
-            group_df = group_df.sort_values('date').copy()
+        Returns:
+            pd.DataFrame: Data with growth metrics
+        """
+        n = len(df)
+        starts = np.flatnonzero(np.diff(group_ids, prepend=-1))
+        ends = np.append(starts[1:], n)
 
-            # Calculate YoY growth
-            group_df['yoy_growth'] = group_df['registration_count'].pct_change(periods=12) * 100
+        metrics = {name: np.empty(n) for name in ['yoy_growth', 'qoq_growth', 'ma_3m', 'ma_6m', 'ma_12m']}
+        _growth_kernel(df['registration_count'].to_numpy(np.float64), starts, ends, *metrics.values())
 
-            # Calculate QoQ growth (3-month periods)
-            group_df['qoq_growth'] = group_df['registration_count'].pct_change(periods=3) * 100
+        for column, values in metrics.items():
+            df[column] = values
 
-            # Calculate rolling averages
-            group_df['ma_3m'] = group_df['registration_count'].rolling(window=3).mean()
-            group_df['ma_6m'] = group_df['registration_count'].rolling(window=6).mean()
-            group_df['ma_12m'] = group_df['registration_count'].rolling(window=12).mean()
+        return df
 
-            result_records.append(group_df)
+    def _calculate_growth_metrics_polars(self, df: pd.DataFrame, series_cols: List[str]) -> pd.DataFrame:
+        """
+        Calculate growth metrics with Polars window expressions
 
-        return pd.concat(result_records, ignore_index=True)
+        Args:
+            df (pd.DataFrame): Input data sorted by series_cols and date
+            series_cols (List[str]): Columns identifying one monthly series
 
+        Returns:
+            pd.DataFrame: Data with growth metrics
+        """
+        counts = pl.col('registration_count')
+
+        # Only the series keys and counts cross into Polars; all five window
+        # expressions are evaluated in one parallel pass over the groups
+        metrics = (
+            pl.from_pandas(df[series_cols + ['registration_count']])
+            .lazy()
+            .select(
+                (counts.pct_change(12).over(series_cols) * 100).alias('yoy_growth'),
+                (counts.pct_change(3).over(series_cols) * 100).alias('qoq_growth'),
+                *[counts.rolling_mean(window).over(series_cols).alias(f'ma_{window}m')
+                  for window in (3, 6, 12)]
+            )
+            .collect()
+        )
+
+        for column in metrics.columns:
+            df[column] = metrics[column].to_numpy()
+
+        return df
+
+    @_cached_on_data_version
     def get_category_summary(self, df: pd.DataFrame = None) -> Dict:
         """
         Get summary statistics by vehicle category
@@ -159,27 +379,58 @@ class VahanDataProcessor:
         if df is None:
             raise ValueError("No data available. Please load/process data first.")
 
-        summary = {}
-
-        for category in df['vehicle_category'].unique():
-            cat_data = df[df['vehicle_category'] == category]
-
-            summary[category] = {
-                'total_registrations': cat_data['registration_count'].sum(),
-                'avg_monthly_registrations': cat_data['registration_count'].mean(),
-                'top_manufacturers': cat_data.groupby('manufacturer')['registration_count'].sum().nlargest(5).to_dict(),
-                'top_states': cat_data.groupby('state')['registration_count'].sum().nlargest(5).to_dict(),
-                'latest_yoy_growth': cat_data['yoy_growth'].dropna().iloc[-1] if not cat_data['yoy_growth'].dropna().empty else 0
+        # One grouper and one aggregation for the per-category statistics;
+        # counts are summed as int64 so large totals cannot overflow int32
+        counts = df['registration_count'].astype(np.int64)
+        category_stats = (
+            pd.DataFrame({'registration_count': counts, 'yoy_growth': df['yoy_growth']})
+            .groupby(df['vehicle_category'], observed=True, sort=False)
+            .agg(
+                total_registrations=('registration_count', 'sum'),
+                avg_monthly_registrations=('registration_count', 'mean'),
+                latest_yoy_growth=('yoy_growth', 'last')
+            )
+        )
+        category_stats['latest_yoy_growth'] = category_stats['latest_yoy_growth'].fillna(0)
+
+        def top_5_by(column: str) -> Dict:
+            sums = counts.groupby([df['vehicle_category'], df[column]], observed=True).sum()
+            top = {}
+            for category, group in sums.groupby(level=0, observed=True):
+                values = group.to_numpy()
+                labels = group.index.get_level_values(1)
+                # argpartition selects the top 5 in linear time; only those are sorted
+                idx = np.arange(len(values))
+                if len(values) > 5:
+                    idx = np.sort(np.argpartition(-values, 5)[:5])
+                idx = idx[np.argsort(-values[idx], kind='stable')]
+                top[category] = dict(zip(labels[idx].tolist(), values[idx].tolist()))
+            return top
+
+        top_manufacturers = top_5_by('manufacturer')
+        top_states = top_5_by('state')
+
+        summary = {
+            category: {
+                'total_registrations': category_stats.at[category, 'total_registrations'],
+                'avg_monthly_registrations': category_stats.at[category, 'avg_monthly_registrations'],
+                'top_manufacturers': top_manufacturers[category],
+                'top_states': top_states[category],
+                'latest_yoy_growth': category_stats.at[category, 'latest_yoy_growth']
             }
+            for category in category_stats.index
+        }
 
         return summary
 
-    def get_manufacturer_analysis(self, df: pd.DataFrame = None) -> pd.DataFrame:
+    @_cached_on_data_version
+    def get_manufacturer_analysis(self, df: pd.DataFrame = None, use_polars: bool = True) -> pd.DataFrame:
         """
         Get comprehensive manufacturer analysis
 
         Args:
             df (pd.DataFrame): Data to analyze
+            use_polars (bool): Aggregate with a Polars lazy query when it is installed
 
         Returns:
             pd.DataFrame: Manufacturer analysis
@@ -187,12 +438,18 @@ class VahanDataProcessor:
         if df is None:
             df = self.processed_data
 
-        # Group by manufacturer and calculate metrics
-        manufacturer_stats = df.groupby('manufacturer').agg({
+        if use_polars and pl is not None:
+            return self._get_manufacturer_analysis_polars(df)
+
+        # Group by manufacturer and calculate metrics; counts are summed as
+        # int64 (as in the Polars path) so large totals cannot overflow int32
+        columns = df[['manufacturer', 'registration_count', 'yoy_growth', 'qoq_growth']]
+        columns = columns.astype({'registration_count': np.int64})
+        manufacturer_stats = columns.groupby('manufacturer', observed=True).agg({
             'registration_count': ['sum', 'mean', 'count'],
             'yoy_growth': 'mean',
             'qoq_growth': 'mean'
-        }).round(2)
+        })
 
         # Flatten column names
         manufacturer_stats.columns = ['total_registrations', 'avg_monthly', 'data_points', 
@@ -202,13 +459,46 @@ class VahanDataProcessor:
         total_market = manufacturer_stats['total_registrations'].sum()
         manufacturer_stats['market_share_pct'] = (
             manufacturer_stats['total_registrations'] / total_market * 100
-        ).round(2)
+        )
 
-        # Sort by total registrations
-        manufacturer_stats = manufacturer_stats.sort_values('total_registrations', ascending=False)
+        # Round once, then sort by total registrations
+        manufacturer_stats = manufacturer_stats.round(2).sort_values('total_registrations', ascending=False)
 
         return manufacturer_stats
 
+    def _get_manufacturer_analysis_polars(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Get manufacturer analysis from a single Polars lazy query
+
+        Args:
+            df (pd.DataFrame): Data to analyze
+
+        Returns:
+            pd.DataFrame: Manufacturer analysis
+        """
+        counts = pl.col('registration_count')
+        totals = pl.col('total_registrations')
+
+        manufacturer_stats = (
+            pl.from_pandas(df[['manufacturer', 'registration_count', 'yoy_growth', 'qoq_growth']])
+            .lazy()
+            .group_by('manufacturer')
+            .agg(
+                counts.cast(pl.Int64).sum().alias('total_registrations'),
+                counts.mean().alias('avg_monthly'),
+                pl.len().cast(pl.Int64).alias('data_points'),
+                pl.col('yoy_growth').mean().alias('avg_yoy_growth'),
+                pl.col('qoq_growth').mean().alias('avg_qoq_growth')
+            )
+            .with_columns((totals / totals.sum() * 100).alias('market_share_pct'))
+            .with_columns(pl.col(pl.Float32, pl.Float64).round(2))
+            .sort('total_registrations', descending=True)
+            .collect()
+        )
+
+        return manufacturer_stats.to_pandas().set_index('manufacturer')
+
+    @_cached_on_data_version
     def get_time_series_data(self, groupby_cols: List[str] = None, 
                            date_range: Tuple[str, str] = None) -> pd.DataFrame:
         """
@@ -224,35 +514,73 @@ class VahanDataProcessor:
         if self.processed_data is None:
             raise ValueError("No processed data available")
 
-        df = self.processed_data.copy()
+        df = self.processed_data
 
-        # Apply date filter if provided
+        # Apply date filter if provided: binary-search the date-sorted view
+        # and take only the matching rows, kept in their original order
         if date_range:
             start_date, end_date = date_range
-            df = df[
-                (df['date'] >= pd.to_datetime(start_date)) & 
-                (df['date'] <= pd.to_datetime(end_date))
-            ]
+            df = df.iloc[self._date_rows(start_date, end_date)]
 
         # Default grouping
         if groupby_cols is None:
             groupby_cols = ['year_month', 'vehicle_category']
 
-        # Aggregate data
-        time_series = df.groupby(groupby_cols).agg({
+        # Aggregate data straight into flat columns; the group keys stay
+        # sorted so each series comes out in chronological order
+        time_series = df.groupby(groupby_cols, as_index=False, observed=True).agg({
             'registration_count': 'sum',
             'yoy_growth': 'mean',
             'qoq_growth': 'mean'
-        }).reset_index()
+        })
 
         return time_series
 
-    def export_processed_data(self, filepath: str = 'processed_vahan_data.csv') -> str:
+    def _date_sort_order(self) -> Tuple[Optional[np.ndarray], np.ndarray]:
+        """
+        Date-sorted row order of processed_data, built once per data version
+
+        Returns:
+            Tuple[Optional[np.ndarray], np.ndarray]: Row positions (None when
+            the rows are already in date order) and their sorted dates
+        """
+        def sort_order():
+            dates = self.processed_data['date'].to_numpy()
+            if (dates[1:] >= dates[:-1]).all():
+                return None, dates
+            order = np.argsort(dates, kind='stable')
+            return order, dates[order]
+
+        return _memoize(self._analysis_cache, ('_date_sort_order', self._data_version), sort_order)
+
+    def _date_rows(self, start_date, end_date):
+        """
+        Rows of processed_data inside an inclusive date range
+
+        Args:
+            start_date: Start of the range
+            end_date: End of the range
+
+        Returns:
+            slice or np.ndarray: A positional slice when the rows are already in
+            date order, otherwise a boolean row mask in the original row order
+        """
+        order, sorted_dates = self._date_sort_order()
+        lo, hi = _date_bounds(sorted_dates, start_date, end_date)
+        if order is None:
+            return slice(lo, hi)
+
+        # Scatter the matching positions into a mask: O(n + k) and no re-sort
+        mask = np.zeros(len(order), dtype=bool)
+        mask[order[lo:hi]] = True
+        return mask
+
+    def export_processed_data(self, filepath: str = 'processed_vahan_data.parquet') -> str:
         """
-        Export processed data to CSV
+        Export processed data to Parquet (or CSV)
 
         Args:
-            filepath (str): Output file path
+            filepath (str): Output file path; a .csv suffix writes CSV instead
 
         Returns:
             str: Path to exported file
@@ -260,17 +588,39 @@ class VahanDataProcessor:
         if self.processed_data is None:
             raise ValueError("No processed data to export")
 
-        self.processed_data.to_csv(filepath, index=False)
+        # year_month is held as a month ordinal; files keep the 'YYYY-MM' labels
+        export_df = self.processed_data.assign(
+            year_month=year_month_labels(self.processed_data['year_month'])
+        )
+
+        if filepath.endswith('.csv'):
+            export_df.to_csv(filepath, index=False)
+        else:
+            # Compressed columnar output that keeps dtypes, so dates and
+            # categoricals need no re-parsing when the file is read back
+            export_df.to_parquet(filepath, engine='pyarrow', compression='zstd', index=False)
         logger.info(f"Processed data exported to {filepath}")
         return filepath
 
 # Helper functions for data filtering and selection
+@lru_cache(maxsize=256)
+def _to_timestamp(value) -> pd.Timestamp:
+    """Parse a date bound once; repeated bounds from UI callbacks hit the cache"""
+    return pd.Timestamp(value)
+
+def _date_bounds(sorted_dates: np.ndarray, start_date, end_date) -> Tuple[int, int]:
+    """Positions bounding an inclusive date range in a sorted datetime64 array"""
+    lo = np.searchsorted(sorted_dates, _to_timestamp(start_date).to_datetime64(), side='left')
+    hi = np.searchsorted(sorted_dates, _to_timestamp(end_date).to_datetime64(), side='right')
+    return lo, hi
+
 def filter_by_date_range(df: pd.DataFrame, start_date: str, end_date: str) -> pd.DataFrame:
     """Filter DataFrame by date range"""
-    return df[
-        (df['date'] >= pd.to_datetime(start_date)) & 
-        (df['date'] <= pd.to_datetime(end_date))
-    ]
+    return df[df['date'].between(_to_timestamp(start_date), _to_timestamp(end_date))]
+
+def year_month_labels(year_month: pd.Series) -> pd.Index:
+    """Convert year_month ordinals to 'YYYY-MM' labels for display and export"""
+    return pd.PeriodIndex.from_ordinals(year_month.to_numpy(), freq='M').astype(str)
 
 def filter_by_categories(df: pd.DataFrame, categories: List[str]) -> pd.DataFrame:
     """Filter DataFrame by vehicle categories"""
@@ -283,4 +633,4 @@ def filter_by_manufacturers(df: pd.DataFrame, manufacturers: List[str]) -> pd.Da
 def get_top_performers(df: pd.DataFrame, metric: str = 'registration_count', 
                       groupby: str = 'manufacturer', n: int = 10) -> pd.DataFrame:
     """Get top performers by specified metric"""
-    return df.groupby(groupby)[metric].sum().nlargest(n).reset_index()
+    return df.groupby(groupby, observed=True)[metric].sum().nlargest(n).reset_index()
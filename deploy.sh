@@ -7,8 +7,34 @@ echo "===================================="
 if [ "$1" = "local" ]; then
     echo "📦 Building and running locally with Docker..."
 
-    # Build the Docker image
-    docker build -t vahan-dashboard .
+    # Lock the dependency set (with hashes) for the image's Python 3.9 when uv
+    # is available; without a lock the image installs from requirements.txt
+    if command -v uv >/dev/null 2>&1; then
+        if [ ! -f requirements.lock ] || [ requirements.txt -nt requirements.lock ]; then
+            echo "🔒 Locking requirements..."
+            uv pip compile --generate-hashes --python-version 3.9 --python-platform linux \
+                -o requirements.lock requirements.txt || exit 1
+        fi
+    elif [ -f requirements.lock ] && [ requirements.txt -nt requirements.lock ]; then
+        echo "❌ requirements.lock is older than requirements.txt; install uv to relock it or delete it"
+        exit 1
+    fi
+
+    # Layer cache shared through a registry, so any machine or CI runner can
+    # reuse every stage's layers (override with VAHAN_CACHE_REF)
+    CACHE_REF="${VAHAN_CACHE_REF:-ghcr.io/${USER}/vahan-cache}"
+
+    # Registry cache export needs a docker-container builder
+    docker buildx create --use --name vahan-builder 2>/dev/null || docker buildx use vahan-builder
+
+    # Build the Docker image with BuildKit, importing and exporting the full
+    # (mode=max) layer cache; a failed cache push does not fail the build, and
+    # --load puts the image in the local engine for docker run
+    docker buildx build \
+        --cache-from=type=registry,ref="$CACHE_REF" \
+        --cache-to=type=registry,ref="$CACHE_REF",mode=max,ignore-error=true \
+        --load \
+        -t vahan-dashboard:latest .
 
     # Run the container
     docker run -d \
@@ -0,0 +1,23 @@
+import plotly.io as pio
+
+from chart_script import fig as architecture_fig
+from chart_script_1 import fig as preview_fig
+
+# Every static chart image and where it is written
+chart_exports = [
+    (architecture_fig, "vahan_architecture_flow.png"),
+    (preview_fig, "vahan_dashboard_preview.png"),
+]
+
+figures = [fig for fig, _ in chart_exports]
+paths = [path for _, path in chart_exports]
+
+# Render all images through a single Kaleido browser session
+if hasattr(pio, "write_images"):
+    pio.write_images(figures, paths)
+else:
+    # Older Plotly/Kaleido: the shared kaleido scope stays alive for the whole process
+    for fig, path in chart_exports:
+        fig.write_image(path)
+
+print(f"Exported {len(paths)} chart images: {', '.join(paths)}")
@@ -2,12 +2,12 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import io
 import warnings
 from datetime import datetime, timedelta, date
-from data_processing import VahanDataProcessor, filter_by_date_range, filter_by_categories, filter_by_manufacturers
+from data_processing import VahanDataProcessor, year_month_labels
 
 # Suppress warnings
 warnings.filterwarnings('ignore')
@@ -59,59 +59,102 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Initialize session state
-if 'data_processor' not in st.session_state:
-    st.session_state.data_processor = None
-if 'processed_data' not in st.session_state:
-    st.session_state.processed_data = None
+@st.cache_resource
+def get_processor():
+    """Shared data processor, kept as a live object rather than pickled per rerun"""
+    return VahanDataProcessor(data_source='sample')
 
 @st.cache_data
-def load_and_process_data():
+def get_processed_data(_processor):
     """Load and process data with caching for performance"""
-    processor = VahanDataProcessor(data_source='sample')
-    raw_data = processor.load_sample_data()
-    processed_data = processor.clean_and_process_data(raw_data)
-    return processor, processed_data
+    raw_data = _processor.load_sample_data()
+    return _processor.clean_and_process_data(raw_data)
+
+@st.cache_data
+def top_n_by(_data, column, n=10):
+    """Top n values of a column by total registrations, used as sidebar defaults"""
+    # _data is always the cached processed frame, so column and n are enough as the cache key
+    return _data.groupby(column, observed=True)['registration_count'].sum().nlargest(n).index.tolist()
+
+# Chart rollups are cached per filter selection (filter_key); the leading
+# underscore stops Streamlit from hashing the filtered frame on every rerun.
+@st.cache_data
+def rollup_by_month_category(_data, filter_key, groupby='vehicle_category'):
+    """Monthly registration totals per category for the current filter selection"""
+    return _data.groupby(['year_month', groupby], observed=True)['registration_count'].sum().reset_index()
+
+@st.cache_data
+def rollup_by_manufacturer(_data, filter_key):
+    """Registration totals per manufacturer for the current filter selection"""
+    return _data.groupby('manufacturer', observed=True)['registration_count'].sum()
+
+@st.cache_data
+def rollup_by_state(_data, filter_key):
+    """Registration totals and mean YoY growth per state for the current filter selection"""
+    return _data.groupby('state', observed=True).agg({
+        'registration_count': 'sum',
+        'yoy_growth': 'mean'
+    }).reset_index()
+
+@st.cache_data
+def manufacturer_summary(_processor, _data, filter_key):
+    """Manufacturer analysis table for the current filter selection"""
+    return _processor.get_manufacturer_analysis(_data)
+
+@st.cache_data
+def category_summary_for(_processor, _data, filter_key):
+    """Per-category summary for the current filter selection"""
+    return _processor.get_category_summary(_data)
+
+def count_observed(column):
+    """Number of distinct values present in a column (integer-code count for categoricals)"""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.codes.to_numpy()
+        return int(np.count_nonzero(np.bincount(codes[codes >= 0], minlength=len(column.cat.categories))))
+    return column.nunique()
+
+def column_options(column):
+    """Distinct values of a column for sidebar options (read from the categories when categorical)"""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.categories.tolist()
+    return pd.unique(column.to_numpy()).tolist()
 
 def create_kpi_metrics(data):
     """Create KPI metrics for the dashboard"""
-    total_registrations = data['registration_count'].sum()
-    unique_manufacturers = data['manufacturer'].nunique()
-    unique_states = data['state'].nunique()
-    latest_month_data = data[data['date'] == data['date'].max()]
-    latest_month_registrations = latest_month_data['registration_count'].sum()
+    registrations = data['registration_count'].to_numpy()
+    dates = data['date'].to_numpy()
+    yoy = data['yoy_growth'].to_numpy()
+    yoy = yoy[~np.isnan(yoy)]
 
     # Calculate YoY growth for latest available data
-    latest_yoy = data['yoy_growth'].dropna().iloc[-100:].mean() if not data['yoy_growth'].dropna().empty else 0
+    latest_yoy = yoy[-100:].mean() if yoy.size else 0
 
     return {
-        'total_registrations': total_registrations,
-        'unique_manufacturers': unique_manufacturers,
-        'unique_states': unique_states,
-        'latest_month_registrations': latest_month_registrations,
+        'total_registrations': registrations.sum(dtype=np.int64),
+        'unique_manufacturers': count_observed(data['manufacturer']),
+        'unique_states': count_observed(data['state']),
+        'latest_month_registrations': registrations[dates == dates.max()].sum(dtype=np.int64),
         'avg_yoy_growth': latest_yoy
     }
 
-def create_time_series_chart(data, metric='registration_count', groupby='vehicle_category'):
-    """Create interactive time series chart"""
-    # Aggregate data by month and category
-    monthly_data = data.groupby(['year_month', groupby])[metric].sum().reset_index()
-    monthly_data['date'] = monthly_data['year_month'].astype(str)
-
-    fig = px.line(
-        monthly_data, 
-        x='date', 
-        y=metric, 
-        color=groupby,
-        title=f'{metric.replace("_", " ").title()} Trend Over Time',
-        labels={
-            'date': 'Year-Month',
-            metric: metric.replace('_', ' ').title(),
-            groupby: groupby.replace('_', ' ').title()
-        }
-    )
+def create_time_series_chart(monthly_data, metric='registration_count', groupby='vehicle_category'):
+    """Create interactive time series chart from a monthly rollup"""
+    fig = go.Figure()
+
+    # One WebGL trace per series, fed straight from the rollup arrays
+    for name, series in monthly_data.groupby(groupby, observed=True, sort=False):
+        fig.add_trace(go.Scattergl(
+            x=year_month_labels(series['year_month']).to_numpy(),
+            y=series[metric].to_numpy(),
+            mode='lines',
+            name=str(name)
+        ))
 
     fig.update_layout(
+        title=f'{metric.replace("_", " ").title()} Trend Over Time',
+        xaxis_title='Year-Month',
+        yaxis_title=metric.replace('_', ' ').title(),
+        legend_title_text=groupby.replace('_', ' ').title(),
         hovermode='x unified',
         xaxis_tickangle=-45,
         height=500
@@ -119,25 +162,28 @@ def create_time_series_chart(data, metric='registration_count', groupby='vehicle
 
     return fig
 
-def create_market_share_chart(data, dimension='manufacturer', top_n=10):
-    """Create market share visualization"""
-    market_data = data.groupby(dimension)['registration_count'].sum().nlargest(top_n)
+def create_market_share_chart(totals, dimension='manufacturer', top_n=10):
+    """Create market share visualization from per-dimension registration totals"""
+    market_data = totals.nlargest(top_n)
 
-    fig = px.pie(
-        values=market_data.values,
-        names=market_data.index,
-        title=f'Market Share by {dimension.replace("_", " ").title()} (Top {top_n})'
-    )
+    fig = go.Figure(go.Pie(
+        values=market_data.to_numpy(),
+        labels=market_data.index.astype(str).to_numpy(),
+        textposition='inside',
+        textinfo='percent+label'
+    ))
 
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    fig.update_layout(height=500)
+    fig.update_layout(
+        title=f'Market Share by {dimension.replace("_", " ").title()} (Top {top_n})',
+        height=500
+    )
 
     return fig
 
 def create_growth_analysis_chart(data):
     """Create growth analysis visualization"""
-    # Filter out infinite values and get recent data
-    growth_data = data[data['yoy_growth'].notna() & np.isfinite(data['yoy_growth'])].copy()
+    # Filter out missing and infinite values in one pass (isfinite is False for NaN)
+    growth_data = data[np.isfinite(data['yoy_growth'].to_numpy())]
 
     if growth_data.empty:
         return go.Figure().add_annotation(
@@ -146,50 +192,107 @@ def create_growth_analysis_chart(data):
             x=0.5, y=0.5, showarrow=False
         )
 
-    # Get latest growth data by manufacturer
-    latest_growth = growth_data.loc[growth_data.groupby('manufacturer')['date'].idxmax()]
-    latest_growth = latest_growth.nlargest(15, 'registration_count')
-
-    fig = px.bar(
-        latest_growth,
-        x='manufacturer',
-        y='yoy_growth',
-        color='vehicle_category',
-        title='Year-over-Year Growth Rate by Manufacturer',
-        labels={'yoy_growth': 'YoY Growth (%)', 'manufacturer': 'Manufacturer'}
+    # Get latest growth data by manufacturer (first row on the latest date, as idxmax would pick)
+    latest_growth = (
+        growth_data.sort_values('date', ascending=False, kind='stable')
+        .drop_duplicates('manufacturer')
+        .nlargest(15, 'registration_count')
     )
 
+    fig = go.Figure()
+
+    for category, bars in latest_growth.groupby('vehicle_category', observed=True, sort=False):
+        fig.add_trace(go.Bar(
+            x=bars['manufacturer'].astype(str).to_numpy(),
+            y=bars['yoy_growth'].to_numpy(),
+            name=str(category)
+        ))
+
     fig.update_layout(
+        title='Year-over-Year Growth Rate by Manufacturer',
+        xaxis_title='Manufacturer',
+        yaxis_title='YoY Growth (%)',
+        legend_title_text='Vehicle Category',
+        xaxis=dict(categoryorder='array', categoryarray=latest_growth['manufacturer'].astype(str).to_numpy()),
         xaxis_tickangle=-45,
         height=500
     )
 
     return fig
 
-def create_state_wise_analysis(data):
-    """Create state-wise analysis visualization"""
-    state_data = data.groupby('state').agg({
-        'registration_count': 'sum',
-        'yoy_growth': 'mean'
-    }).reset_index()
-
+def create_state_wise_analysis(state_data):
+    """Create state-wise analysis visualization from a per-state rollup"""
     state_data = state_data.sort_values('registration_count', ascending=False).head(15)
 
-    fig = px.bar(
-        state_data,
-        x='state',
-        y='registration_count',
-        title='Total Vehicle Registrations by State',
-        labels={'registration_count': 'Total Registrations', 'state': 'State'}
-    )
+    fig = go.Figure(go.Bar(
+        x=state_data['state'].astype(str).to_numpy(),
+        y=state_data['registration_count'].to_numpy()
+    ))
 
     fig.update_layout(
+        title='Total Vehicle Registrations by State',
+        xaxis_title='State',
+        yaxis_title='Total Registrations',
         xaxis_tickangle=-45,
         height=500
     )
 
     return fig
 
+# File extension and MIME type for each export format
+EXPORT_FORMATS = {
+    "CSV": ('csv', 'text/csv'),
+    "Excel": ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    "Parquet": ('parquet', 'application/vnd.apache.parquet'),
+}
+
+# Streamlit 1.51+ accepts a callable for download data and only runs it on
+# click; older releases (1.50 is the last one for Python 3.9) need the bytes
+DEFERRED_DOWNLOADS = tuple(int(part) for part in st.__version__.split('.')[:2]) >= (1, 51)
+
+def build_export_file(data, export_format):
+    """Serialize data for download in the given export format"""
+    buffer = io.BytesIO()
+
+    # Exports carry readable 'YYYY-MM' labels rather than the integer month ordinals
+    data = data.assign(year_month=year_month_labels(data['year_month']))
+
+    if export_format == "Excel":
+        # No constant_memory here: pandas writes cells column by column, and
+        # xlsxwriter's streaming mode silently drops out-of-order cells
+        with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
+            data.to_excel(writer, index=False, sheet_name='Vahan Data')
+    elif export_format == "Parquet":
+        data.to_parquet(buffer, engine='pyarrow', compression='zstd', index=False)
+    else:
+        # CSV is encoded straight into the byte buffer in chunks, never as one big str
+        data.to_csv(buffer, index=False, chunksize=100_000)
+
+    return buffer.getvalue()
+
+@st.fragment
+def export_panel(data):
+    """Data export controls; interacting with them reruns only this fragment"""
+    st.markdown("### Export Filtered Data")
+
+    export_format = st.selectbox("Export Format", list(EXPORT_FORMATS))
+    extension, mime = EXPORT_FORMATS[export_format]
+
+    # Where supported, the file is only serialized when the user actually
+    # clicks download; otherwise it is built for the current selection
+    if DEFERRED_DOWNLOADS:
+        export_data = lambda: build_export_file(data, export_format)
+    else:
+        export_data = build_export_file(data, export_format)
+
+    st.download_button(
+        label=f"Download {export_format}",
+        data=export_data,
+        file_name=f"vahan_data_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}",
+        mime=mime,
+        on_click="ignore"
+    )
+
 def main():
     """Main dashboard application"""
 
@@ -199,13 +302,8 @@ def main():
 
     # Load data
     with st.spinner('Loading and processing data...'):
-        if st.session_state.data_processor is None:
-            processor, processed_data = load_and_process_data()
-            st.session_state.data_processor = processor
-            st.session_state.processed_data = processed_data
-        else:
-            processor = st.session_state.data_processor
-            processed_data = st.session_state.processed_data
+        processor = get_processor()
+        processed_data = get_processed_data(processor)
 
     # Sidebar filters
     st.sidebar.markdown("## 🎛️ Dashboard Filters")
@@ -222,53 +320,59 @@ def main():
     )
 
     # Vehicle category filter
+    category_options = column_options(processed_data['vehicle_category'])
     categories = st.sidebar.multiselect(
         "Vehicle Categories",
-        options=list(processed_data['vehicle_category'].unique()),
-        default=list(processed_data['vehicle_category'].unique())
+        options=category_options,
+        default=category_options
     )
 
     # State filter
-    top_states = processed_data.groupby('state')['registration_count'].sum().nlargest(10).index.tolist()
+    top_states = top_n_by(processed_data, 'state')
     selected_states = st.sidebar.multiselect(
         "States",
-        options=list(processed_data['state'].unique()),
+        options=column_options(processed_data['state']),
         default=top_states
     )
 
     # Manufacturer filter
-    top_manufacturers = processed_data.groupby('manufacturer')['registration_count'].sum().nlargest(10).index.tolist()
+    top_manufacturers = top_n_by(processed_data, 'manufacturer')
     selected_manufacturers = st.sidebar.multiselect(
         "Manufacturers",
-        options=list(processed_data['manufacturer'].unique()),
+        options=column_options(processed_data['manufacturer']),
         default=top_manufacturers
     )
 
-    # Apply filters
-    filtered_data = processed_data.copy()
+    # Apply filters: combine every condition into one mask and slice once
+    mask = np.ones(len(processed_data), dtype=bool)
 
     if len(date_range) == 2:
         start_date, end_date = date_range
-        filtered_data = filter_by_date_range(
-            filtered_data, 
-            start_date.strftime('%Y-%m-%d'), 
-            end_date.strftime('%Y-%m-%d')
-        )
+        dates = processed_data['date'].to_numpy()
+        mask &= (dates >= np.datetime64(start_date)) & (dates <= np.datetime64(end_date))
 
     if categories:
-        filtered_data = filter_by_categories(filtered_data, categories)
+        mask &= processed_data['vehicle_category'].isin(categories).to_numpy()
 
     if selected_states:
-        filtered_data = filtered_data[filtered_data['state'].isin(selected_states)]
+        mask &= processed_data['state'].isin(selected_states).to_numpy()
 
     if selected_manufacturers:
-        filtered_data = filter_by_manufacturers(filtered_data, selected_manufacturers)
+        mask &= processed_data['manufacturer'].isin(selected_manufacturers).to_numpy()
+
+    filtered_data = processed_data[mask]
 
     # Check if filtered data is empty
     if filtered_data.empty:
         st.error("No data available for the selected filters. Please adjust your selection.")
         return
 
+    # Pre-aggregate once per filter selection; charts only read these small frames
+    filter_key = (tuple(date_range), tuple(categories), tuple(selected_states), tuple(selected_manufacturers))
+    monthly_rollup = rollup_by_month_category(filtered_data, filter_key)
+    manufacturer_rollup = rollup_by_manufacturer(filtered_data, filter_key)
+    state_rollup = rollup_by_state(filtered_data, filter_key)
+
     # KPI Metrics
     st.markdown("## 📊 Key Performance Indicators")
     kpis = create_kpi_metrics(filtered_data)
@@ -317,11 +421,11 @@ def main():
     col1, col2 = st.columns(2)
 
     with col1:
-        time_series_fig = create_time_series_chart(filtered_data, 'registration_count', 'vehicle_category')
+        time_series_fig = create_time_series_chart(monthly_rollup, 'registration_count', 'vehicle_category')
         st.plotly_chart(time_series_fig, use_container_width=True)
 
     with col2:
-        market_share_fig = create_market_share_chart(filtered_data, 'manufacturer', 8)
+        market_share_fig = create_market_share_chart(manufacturer_rollup, 'manufacturer', 8)
         st.plotly_chart(market_share_fig, use_container_width=True)
 
     # Growth and regional analysis
@@ -334,7 +438,7 @@ def main():
         st.plotly_chart(growth_fig, use_container_width=True)
 
     with col2:
-        state_fig = create_state_wise_analysis(filtered_data)
+        state_fig = create_state_wise_analysis(state_rollup)
         st.plotly_chart(state_fig, use_container_width=True)
 
     # Detailed analysis section
@@ -344,7 +448,7 @@ def main():
 
     with tab1:
         st.markdown("### Top Manufacturers Performance")
-        manufacturer_analysis = processor.get_manufacturer_analysis(filtered_data)
+        manufacturer_analysis = manufacturer_summary(processor, filtered_data, filter_key)
         st.dataframe(
             manufacturer_analysis.head(15),
             use_container_width=True
@@ -352,7 +456,7 @@ def main():
 
     with tab2:
         st.markdown("### Vehicle Category Summary")
-        category_summary = processor.get_category_summary(filtered_data)
+        category_summary = category_summary_for(processor, filtered_data, filter_key)
 
         for category, stats in category_summary.items():
             with st.expander(f"📋 {category} Analysis"):
@@ -369,28 +473,7 @@ def main():
                         st.write(f"• {mfr}: {count:,.0f}")
 
     with tab3:
-        st.markdown("### Export Filtered Data")
-
-        export_format = st.selectbox("Export Format", ["CSV", "Excel"])
-
-        if st.button("Generate Export File"):
-            if export_format == "CSV":
-                csv_data = filtered_data.to_csv(index=False)
-                st.download_button(
-                    label="Download CSV",
-                    data=csv_data,
-                    file_name=f"vahan_data_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-            else:
-                # For Excel export, we'll use CSV for this demo
-                csv_data = filtered_data.to_csv(index=False)
-                st.download_button(
-                    label="Download Data",
-                    data=csv_data,
-                    file_name=f"vahan_data_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
+        export_panel(filtered_data)
 
     # Investor insights section
     st.markdown("## 💼 Investor Insights")
@@ -4,14 +4,22 @@
 import pandas as pd
 import numpy as np
 import json
-from datetime import datetime, timedelta
-import random
 from typing import Dict, List, Tuple
 
+def categorical_from_index(labels, idx):
+    """
+    Build a categorical column by gathering a small label array with row indices
+    """
+    labels = pd.Categorical(labels)
+    return pd.Categorical.from_codes(labels.codes[idx], categories=labels.categories)
+
 # Create sample vehicle registration data that mirrors Vahan Dashboard structure
-def generate_sample_vahan_data():
+def generate_sample_vahan_data(seed=42):
     """
     Generate comprehensive sample data that mimics Vahan Dashboard structure
+    
+    All random draws come from one seeded NumPy Generator, so the same seed
+    always produces the same dataset (pass seed=None for fresh data)
     """
     
     # Vehicle categories and classes from Vahan dashboard
@@ -40,85 +48,83 @@ def generate_sample_vahan_data():
     ]
     
     # Generate monthly data from 2020 to 2024
-    start_date = datetime(2020, 1, 1)
-    end_date = datetime(2024, 12, 31)
-    
-    data_records = []
-    
-    # Generate data for each month
-    current_date = start_date
-    while current_date <= end_date:
-        year = current_date.year
-        month = current_date.month
-        month_name = current_date.strftime("%B")
-        
-        # Generate data for each state
-        for state in states:
-            # Generate data for each vehicle category
-            for category, classes in vehicle_categories.items():
-                for vehicle_class in classes:
-                    # Generate data for each manufacturer relevant to this category
-                    for manufacturer in manufacturers[category]:
-                        
-                        # Base registration count with realistic trends
-                        base_count = {
-                            "2W": random.randint(5000, 25000),
-                            "3W": random.randint(500, 3000),
-                            "4W": random.randint(1000, 8000)
-                        }[category]
-                        
-                        # Apply market share adjustments for major players
-                        if manufacturer in ["HERO MOTOCORP LTD", "MARUTI SUZUKI INDIA LTD"]:
-                            base_count *= random.uniform(1.5, 2.5)
-                        elif manufacturer in ["HONDA MOTORCYCLE & SCOOTER INDIA", "HYUNDAI MOTOR INDIA LTD", "TATA MOTORS LTD"]:
-                            base_count *= random.uniform(1.2, 1.8)
-                        
-                        # Apply seasonal variations
-                        seasonal_factor = 1.0
-                        if month in [3, 4, 10, 11]:  # Peak seasons
-                            seasonal_factor = random.uniform(1.2, 1.4)
-                        elif month in [6, 7, 8]:  # Monsoon dip
-                            seasonal_factor = random.uniform(0.7, 0.9)
-                        
-                        # Apply COVID impact for 2020-2021
-                        if year == 2020 and month >= 4:
-                            seasonal_factor *= random.uniform(0.3, 0.6)
-                        elif year == 2021:
-                            seasonal_factor *= random.uniform(0.6, 0.9)
-                        
-                        # Apply growth trends
-                        growth_factor = 1.0
-                        if category == "2W":
-                            if "ELECTRIC" in manufacturer or "E-" in vehicle_class:
-                                growth_factor = 1.0 + (year - 2020) * 0.3  # EV growth
-                        
-                        final_count = int(base_count * seasonal_factor * growth_factor)
-                        final_count = max(1, final_count)  # Ensure at least 1
-                        
-                        data_records.append({
-                            "year": year,
-                            "month": month,
-                            "month_name": month_name,
-                            "state": state,
-                            "vehicle_category": category,
-                            "vehicle_class": vehicle_class,
-                            "manufacturer": manufacturer,
-                            "registration_count": final_count,
-                            "date": current_date
-                        })
-        
-        # Move to next month
-        if current_date.month == 12:
-            current_date = current_date.replace(year=current_date.year + 1, month=1)
-        else:
-            current_date = current_date.replace(month=current_date.month + 1)
-    
-    # Create DataFrame
-    df = pd.DataFrame(data_records)
-    
-    # Add some derived columns for analysis
-    df['quarter'] = df['month'].apply(lambda x: f"Q{(x-1)//3 + 1}")
-    df['financial_year'] = df.apply(lambda x: f"FY{x['year']+1}" if x['month'] >= 4 else f"FY{x['year']}", axis=1)
+    dates = pd.date_range(start="2020-01-01", end="2024-12-31", freq="MS")
+    
+    # Every (category, class, manufacturer) combination, in generation order
+    combos = [
+        (category, vehicle_class, manufacturer)
+        for category, classes in vehicle_categories.items()
+        for vehicle_class in classes
+        for manufacturer in manufacturers[category]
+    ]
+    combo_frame = pd.DataFrame(combos, columns=["vehicle_category", "vehicle_class", "manufacturer"])
+    
+    n_months, n_states, n_combos = len(dates), len(states), len(combos)
+    n_rows = n_months * n_states * n_combos
+    
+    # Row layout is month -> state -> combination, described by integer index arrays
+    month_idx = np.repeat(np.arange(n_months), n_states * n_combos)
+    state_idx = np.tile(np.repeat(np.arange(n_states), n_combos), n_months)
+    combo_idx = np.tile(np.arange(n_combos), n_months * n_states)
+    
+    year = dates.year.to_numpy().astype(np.int16)[month_idx]
+    month = dates.month.to_numpy().astype(np.int8)[month_idx]
+    combo_category = combo_frame["vehicle_category"].to_numpy()
+    combo_manufacturer = combo_frame["manufacturer"].to_numpy()
+    
+    rng = np.random.default_rng(seed)
+    
+    # Base registration count with realistic trends
+    base_ranges = {"2W": (5000, 25000), "3W": (500, 3000), "4W": (1000, 8000)}
+    counts = np.empty(n_rows, dtype=np.float64)
+    for cat, (low, high) in base_ranges.items():
+        mask = (combo_category == cat)[combo_idx]
+        counts[mask] = rng.integers(low, high, endpoint=True, size=mask.sum())
+    
+    # Every adjustment below scales only the rows it applies to, in place,
+    # drawing random factors just for those rows
+    def scale(mask, low, high):
+        counts[mask] *= rng.uniform(low, high, mask.sum())
+    
+    # Apply market share adjustments for major players
+    scale(np.isin(combo_manufacturer, ["HERO MOTOCORP LTD", "MARUTI SUZUKI INDIA LTD"])[combo_idx], 1.5, 2.5)
+    scale(np.isin(combo_manufacturer, ["HONDA MOTORCYCLE & SCOOTER INDIA", "HYUNDAI MOTOR INDIA LTD", "TATA MOTORS LTD"])[combo_idx], 1.2, 1.8)
+    
+    # Apply seasonal variations
+    scale(np.isin(month, [3, 4, 10, 11]), 1.2, 1.4)  # Peak seasons
+    scale(np.isin(month, [6, 7, 8]), 0.7, 0.9)  # Monsoon dip
+    
+    # Apply COVID impact for 2020-2021
+    scale((year == 2020) & (month >= 4), 0.3, 0.6)
+    scale(year == 2021, 0.6, 0.9)
+    
+    # Apply growth trends (EV growth), decided once per combination
+    is_ev = (
+        (combo_frame["vehicle_category"] == "2W")
+        & (combo_frame["manufacturer"].str.contains("ELECTRIC", regex=False)
+           | combo_frame["vehicle_class"].str.contains("E-", regex=False))
+    ).to_numpy()[combo_idx]
+    counts[is_ev] *= 1.0 + (year[is_ev] - 2020) * 0.3
+    
+    final_count = np.maximum(counts.astype(np.int32), 1)  # Ensure at least 1
+    
+    # Month-level labels, computed once per month rather than per row
+    fy_labels = np.char.add("FY", np.where(dates.month >= 4, dates.year + 1, dates.year).astype(str))
+    
+    # Create DataFrame straight from typed column arrays; repeated labels become categoricals
+    df = pd.DataFrame({
+        "year": year,
+        "month": month,
+        "month_name": categorical_from_index(dates.strftime("%B"), month_idx),
+        "state": categorical_from_index(states, state_idx),
+        "vehicle_category": categorical_from_index(combo_category, combo_idx),
+        "vehicle_class": categorical_from_index(combo_frame["vehicle_class"], combo_idx),
+        "manufacturer": categorical_from_index(combo_manufacturer, combo_idx),
+        "registration_count": final_count,
+        "date": dates.to_numpy()[month_idx],
+        "quarter": pd.Categorical.from_codes((month - 1) // 3, categories=["Q1", "Q2", "Q3", "Q4"]),
+        "financial_year": categorical_from_index(fy_labels, month_idx)
+    })
     
     return df
 
@@ -136,6 +142,10 @@ print(f"Manufacturers: {sample_data['manufacturer'].nunique()}")
 print("\nSample data preview:")
 print(sample_data.head(10))
 
-# Save sample data
+# Save sample data; rows are in date order, so one row group per month lets
+# date filters skip whole row groups when scanning the Parquet file
+rows_per_month = len(sample_data) // sample_data['date'].nunique()
+sample_data.to_parquet('vahan_sample_data.parquet', engine='pyarrow', compression='zstd',
+                       index=False, row_group_size=rows_per_month)
 sample_data.to_csv('vahan_sample_data.csv', index=False)
-print("\nSample data saved as 'vahan_sample_data.csv'")
\ No newline at end of file
+print("\nSample data saved as 'vahan_sample_data.parquet' and 'vahan_sample_data.csv'")
\ No newline at end of file
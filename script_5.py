@@ -15,10 +15,12 @@ from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
+from io import StringIO
 import random
 import json
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree, html
 from typing import Dict, List, Optional, Tuple
 
 # Configure logging
@@ -240,37 +242,40 @@ class VahanWebScraper:
             
             # Get table HTML
             table_element = self.driver.find_element(By.ID, self.form_elements['data_table'])
-            table_html = table_element.get_attribute('outerHTML')
-            
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(table_html, 'html.parser')
-            
-            # Extract headers
-            headers = []
-            header_row = soup.find('tr')
-            if header_row:
-                headers = [th.get_text().strip() for th in header_row.find_all(['th', 'td'])]
-            
-            # Extract data rows
-            rows = []
-            for row in soup.find_all('tr')[1:]:  # Skip header
-                row_data = [td.get_text().strip() for td in row.find_all(['td', 'th'])]
-                if row_data:
-                    rows.append(row_data)
-            
-            # Create DataFrame
-            if rows and headers:
-                df = pd.DataFrame(rows, columns=headers[:len(rows[0])])
-                logger.info(f"Extracted {len(df)} rows of data")
-                return df
-            else:
-                logger.warning("No data found in table")
-                return pd.DataFrame()
+            return self._parse_table_html(table_element.get_attribute('outerHTML'))
                 
         except Exception as e:
             logger.error(f"Error extracting table data: {e}")
             return pd.DataFrame()
     
+    def _parse_table_html(self, table_html: str) -> pd.DataFrame:
+        """
+        Parse the results table markup into a DataFrame
+        
+        Args:
+            table_html (str): Outer HTML of the data table (or its body)
+        
+        Returns:
+            pd.DataFrame: Parsed data
+        """
+        # The element id points at the table body, so wrap it in a table
+        # for pd.read_html; the first row holds the column headers
+        if not table_html.lstrip().startswith('<table'):
+            table_html = f"<table>{table_html}</table>"
+        
+        # Parse straight into a DataFrame with lxml's C parser
+        try:
+            df = pd.read_html(StringIO(table_html), header=0, flavor='lxml')[0]
+        except ValueError:
+            df = pd.DataFrame()
+        
+        if not df.empty:
+            logger.info(f"Extracted {len(df)} rows of data")
+            return df
+        else:
+            logger.warning("No data found in table")
+            return pd.DataFrame()
+    
     def scrape_state_data(self, state_name: str, years: List[int]) -> pd.DataFrame:
         """
         Scrape data for a specific state across multiple years
@@ -313,44 +318,235 @@ class VahanWebScraper:
         
         return pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     
-    def scrape_multiple_states(self, states: List[str], years: List[int]) -> pd.DataFrame:
+    def _scrape_one_state(self, state_name: str, years: List[int]) -> pd.DataFrame:
+        """
+        Scrape one state in its own browser session
+        
+        WebDriver instances are not thread-safe, so each worker thread gets
+        a separate scraper with its own driver
+        
+        Args:
+            state_name (str): State to scrape data for
+            years (List[int]): Years to extract data for
+        
+        Returns:
+            pd.DataFrame: Combined data for all years
+        """
+        worker = VahanWebScraper(headless=self.headless, timeout=self.timeout)
+        
+        try:
+            worker.driver = worker.setup_driver()
+            
+            if not worker.navigate_to_dashboard():
+                return pd.DataFrame()
+            
+            return worker.scrape_state_data(state_name, years)
+        
+        finally:
+            if worker.driver:
+                worker.driver.quit()
+                logger.info(f"WebDriver closed for {state_name}")
+    
+    def scrape_multiple_states(self, states: List[str], years: List[int],
+                               max_workers: int = 4) -> pd.DataFrame:
         """
         Scrape data for multiple states and years
         
         Args:
             states (List[str]): List of states to scrape
             years (List[int]): List of years to scrape
+            max_workers (int): Number of states scraped concurrently
             
         Returns:
             pd.DataFrame: Combined data for all states and years
         """
         all_data = []
         
-        try:
-            self.driver = self.setup_driver()
-            
-            if not self.navigate_to_dashboard():
-                return pd.DataFrame()
-            
-            for state in states:
+        # Page loads and delays dominate, so states are scraped on a small
+        # thread pool; the cap keeps the load on the dashboard polite
+        with ThreadPoolExecutor(max_workers=max(1, min(len(states), max_workers))) as executor:
+            futures = [
+                (state, executor.submit(self._scrape_one_state, state, years))
+                for state in states
+            ]
+            
+            for state, future in futures:
                 try:
-                    state_data = self.scrape_state_data(state, years)
+                    state_data = future.result()
                     if not state_data.empty:
                         all_data.append(state_data)
                     
-                    # Add delay between states
-                    time.sleep(random.uniform(5, 10))
-                    
                 except Exception as e:
                     logger.error(f"Error scraping {state}: {e}")
                     continue
             
-            return pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
+        return pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
             
-        finally:
-            if self.driver:
-                self.driver.quit()
-                logger.info("WebDriver closed")
+    @staticmethod
+    def _select_options(tree, select_id: str) -> Dict[str, str]:
+        """
+        Map the visible labels of a <select> to their option values
+        
+        Args:
+            tree: Parsed HTML containing the select element
+            select_id (str): ID of the select element
+        
+        Returns:
+            Dict[str, str]: Option value for each label
+        """
+        return {
+            option.text_content().strip(): option.get('value')
+            for option in tree.xpath(f"//select[@id='{select_id}']/option")
+        }
+    
+    @staticmethod
+    def _selected_value(tree, select_id: str) -> Optional[str]:
+        """
+        Value of the selected option of a <select>, if any
+        
+        Args:
+            tree: Parsed HTML containing the select element
+            select_id (str): ID of the select element
+        
+        Returns:
+            Optional[str]: Selected option value, or None if not found
+        """
+        selected = tree.xpath(f"//select[@id='{select_id}']/option[@selected]/@value")
+        return selected[0] if selected else None
+    
+    def _start_http_session(self) -> Tuple[requests.Session, str, Dict[str, Dict[str, str]]]:
+        """
+        Open an HTTP session on the dashboard and read its JSF view state
+        
+        Returns:
+            Tuple[requests.Session, str, Dict[str, Dict[str, str]]]: Session,
+            javax.faces.ViewState token and the label to value map of the
+            state and year dropdowns
+        """
+        session = requests.Session()
+        session.headers['User-Agent'] = (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        )
+        
+        response = session.get(self.base_url, timeout=self.timeout)
+        response.raise_for_status()
+        
+        page = html.fromstring(response.content)
+        view_state = page.xpath("//input[@name='javax.faces.ViewState']/@value")
+        if not view_state:
+            raise ValueError("javax.faces.ViewState not found on dashboard page")
+        
+        # The ..._input selects submit option values, not the visible labels
+        options = {
+            dropdown: self._select_options(page, self.form_elements[dropdown])
+            for dropdown in ('state_dropdown', 'year_dropdown')
+        }
+        
+        return session, view_state[0], options
+    
+    def fetch_state_year_data(self, state_name: str, year: int) -> pd.DataFrame:
+        """
+        Fetch one state/year table with a PrimeFaces partial AJAX request
+        
+        This posts the same partial request the refresh button fires in the
+        browser, so no WebDriver is needed
+        
+        Args:
+            state_name (str): State to fetch data for
+            year (int): Year to fetch data for
+        
+        Returns:
+            pd.DataFrame: Extracted data
+        """
+        # The view state is bound to a session, so each request gets its own
+        session, view_state, options = self._start_http_session()
+        
+        state_value = options['state_dropdown'].get(state_name)
+        year_value = options['year_dropdown'].get(str(year))
+        if state_value is None or year_value is None:
+            raise ValueError(f"{state_name} - {year} is not offered by the dashboard dropdowns")
+        
+        form_id = self.form_elements['refresh_button'].split(':')[0]
+        refresh_button = self.form_elements['refresh_button']
+        payload = {
+            'javax.faces.partial.ajax': 'true',
+            'javax.faces.source': refresh_button,
+            'javax.faces.partial.execute': '@all',
+            'javax.faces.partial.render': form_id,
+            refresh_button: refresh_button,
+            form_id: form_id,
+            self.form_elements['state_dropdown']: state_value,
+            self.form_elements['year_dropdown']: year_value,
+            'javax.faces.ViewState': view_state
+        }
+        headers = {
+            'Faces-Request': 'partial/ajax',
+            'X-Requested-With': 'XMLHttpRequest'
+        }
+        
+        response = session.post(self.base_url, data=payload, headers=headers, timeout=self.timeout)
+        response.raise_for_status()
+        
+        # The partial response is XML whose <update> elements carry the
+        # re-rendered markup as CDATA; pick the one containing the table
+        table_id = self.form_elements['data_table']
+        for update in etree.fromstring(response.content).iter('update'):
+            if update.text and table_id in update.text:
+                markup = html.fromstring(update.text)
+                
+                # An unrecognised selection makes the server re-render its
+                # default view, which is not the requested state's data
+                selected_state = self._selected_value(markup, self.form_elements['state_dropdown'])
+                if selected_state != state_value:
+                    raise ValueError(
+                        f"Response is for state value {selected_state!r}, expected {state_value!r} ({state_name})"
+                    )
+                
+                table = markup.get_element_by_id(table_id)
+                data = self._parse_table_html(etree.tostring(table, encoding='unicode'))
+                if not data.empty:
+                    data['state'] = state_name
+                    data['year'] = year
+                    data['extraction_date'] = datetime.now()
+                return data
+        
+        logger.warning(f"No table update in response for {state_name} - {year}")
+        return pd.DataFrame()
+    
+    def scrape_multiple_states_http(self, states: List[str], years: List[int],
+                                    max_workers: int = 8) -> pd.DataFrame:
+        """
+        Scrape data for multiple states and years over plain HTTP
+        
+        Args:
+            states (List[str]): List of states to scrape
+            years (List[int]): List of years to scrape
+            max_workers (int): Number of concurrent requests
+        
+        Returns:
+            pd.DataFrame: Combined data for all states and years
+        """
+        all_data = []
+        pairs = [(state, year) for state in states for year in years]
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(len(pairs), max_workers))) as executor:
+            futures = [
+                (state, year, executor.submit(self.fetch_state_year_data, state, year))
+                for state, year in pairs
+            ]
+            
+            for state, year, future in futures:
+                try:
+                    year_data = future.result()
+                    if not year_data.empty:
+                        all_data.append(year_data)
+                
+                except Exception as e:
+                    logger.error(f"Error fetching {state} - {year}: {e}")
+                    continue
+        
+        return pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     
     def save_scraped_data(self, data: pd.DataFrame, filepath: str = None) -> str:
         """
@@ -405,7 +601,12 @@ def scrape_vahan_comprehensive_data(
     try:
         # Scrape data
         logger.info(f"Starting scraping for {len(states)} states and {len(years)} years")
-        scraped_data = scraper.scrape_multiple_states(states, years)
+        scraped_data = scraper.scrape_multiple_states_http(states, years)
+        
+        # Fall back to driving a browser if the AJAX requests yield nothing
+        if scraped_data.empty:
+            logger.warning("HTTP scraping returned no data, falling back to Selenium")
+            scraped_data = scraper.scrape_multiple_states(states, years)
         
         if scraped_data.empty:
             logger.error("No data was scraped successfully")
@@ -439,9 +640,10 @@ print("✅ Selenium-based browser automation")
 print("✅ Anti-detection measures (user agents, delays)")
 print("✅ Robust error handling and retries")
 print("✅ State and year selection automation")
-print("✅ Table data extraction with BeautifulSoup")
+print("✅ Table data extraction with pandas.read_html (lxml)")
+print("✅ Direct HTTP (PrimeFaces AJAX) path with Selenium fallback")
 print("✅ Comprehensive logging system")
 print("✅ Data export functionality")
-print("✅ Multi-state and multi-year scraping")
+print("✅ Concurrent multi-state and multi-year scraping")
 print("✅ Rate limiting to avoid blocking")
 print("✅ Production-ready architecture")
\ No newline at end of file
@@ -21,41 +21,126 @@ font = "sans serif"
 '''
 
 import os
-os.makedirs('.streamlit', exist_ok=True)
-with open('.streamlit/config.toml', 'w') as f:
-    f.write(streamlit_config)
+from pathlib import Path
+
+def write_if_changed(path, content):
+    """
+    Write content to path unless the file already holds exactly these bytes
+
+    Skipping identical rewrites keeps the file's mtime, so file watchers and
+    the Docker build context see no change.
+    """
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    data = content.encode('utf-8')
+    if p.exists() and p.read_bytes() == data:
+        return
+    p.write_bytes(data)
+
+write_if_changed('.streamlit/config.toml', streamlit_config)
 
 # 2. Create Dockerfile for containerization
-dockerfile_content = '''FROM python:3.9-slim
+dockerfile_content = '''# syntax=docker/dockerfile:1.4
 
-WORKDIR /app
+# Build stage: download tools, Chrome, ChromeDriver and Python packages;
+# none of the download tooling ends up in the runtime image
+FROM python:3.9-slim-bookworm AS builder
+
+WORKDIR /build
 
-# Install system dependencies
-RUN apt-get update && apt-get install -y \\
+# Install build-only system dependencies in a single layer; removing
+# docker-clean keeps downloaded .debs in the persistent apt cache mounts
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \\
+    --mount=type=cache,target=/var/lib/apt/lists,sharing=locked \\
+    rm -f /etc/apt/apt.conf.d/docker-clean \\
+    && apt-get update && apt-get install -y --no-install-recommends \\
+    ca-certificates \\
     wget \\
-    gnupg \\
-    unzip \\
-    curl \\
-    && rm -rf /var/lib/apt/lists/*
-
-# Install Chrome and ChromeDriver for Selenium
-RUN wget -q -O - https://dl.google.com/linux/linux_signing_key.pub | apt-key add - \\
-    && echo "deb [arch=amd64] http://dl.google.com/linux/chrome/deb/ stable main" >> /etc/apt/sources.list.d/google-chrome.list \\
-    && apt-get update \\
-    && apt-get install -y google-chrome-stable \\
-    && rm -rf /var/lib/apt/lists/*
-
-# Install ChromeDriver
-RUN CHROMEDRIVER_VERSION=`curl -sS chromedriver.storage.googleapis.com/LATEST_RELEASE` \\
-    && wget -N http://chromedriver.storage.googleapis.com/$CHROMEDRIVER_VERSION/chromedriver_linux64.zip \\
-    && unzip chromedriver_linux64.zip \\
-    && rm chromedriver_linux64.zip \\
-    && mv chromedriver /usr/local/bin/chromedriver \\
+    unzip
+
+# Chrome and ChromeDriver come from the same pinned Chrome for Testing
+# release, which keeps every version available and the two always matched;
+# bump CHROME_VERSION to upgrade both
+ARG CHROME_VERSION=120.0.6099.224
+RUN wget -q https://storage.googleapis.com/chrome-for-testing-public/${CHROME_VERSION}/linux64/chrome-linux64.zip \\
+    && unzip -q chrome-linux64.zip \\
+    && rm chrome-linux64.zip \\
+    && mkdir -p /opt/google \\
+    && mv chrome-linux64 /opt/google/chrome
+
+RUN wget -q https://storage.googleapis.com/chrome-for-testing-public/${CHROME_VERSION}/linux64/chromedriver-linux64.zip \\
+    && unzip chromedriver-linux64.zip \\
+    && rm chromedriver-linux64.zip \\
+    && mv chromedriver-linux64/chromedriver /usr/local/bin/chromedriver \\
+    && rm -rf chromedriver-linux64 \\
     && chmod +x /usr/local/bin/chromedriver
 
-# Copy requirements and install Python dependencies
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
+# uv resolves and installs the requirements far faster than pip
+COPY --from=ghcr.io/astral-sh/uv:0.5.11 /uv /usr/local/bin/uv
+
+# Install Python dependencies into a separate prefix for the runtime stage.
+# A hash-pinned requirements.lock, when present, fixes every transitive
+# version, so this layer's cache key matches the packages it produces;
+# without one, requirements.txt is resolved instead (the uv cache lives in a
+# BuildKit cache mount, so only new wheels are downloaded and none of it
+# lands in the image)
+COPY requirements.txt requirements.lock* ./
+RUN --mount=type=cache,target=/root/.cache/uv \\
+    if [ -f requirements.lock ]; then \\
+        UV_LINK_MODE=copy uv pip install --system --prefix=/install \\
+        --require-hashes --no-deps -r requirements.lock; \\
+    else \\
+        UV_LINK_MODE=copy uv pip install --system --prefix=/install -r requirements.txt; \\
+    fi
+
+# Runtime stage: Chrome, ChromeDriver, Python packages and the application
+FROM python:3.9-slim-bookworm
+
+WORKDIR /app
+
+# Install Chrome's runtime libraries (the google-chrome-stable package
+# dependencies on bookworm), plus curl for the health check, in a single apt
+# layer; google-chrome on PATH points at the Chrome copied in below
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \\
+    --mount=type=cache,target=/var/lib/apt/lists,sharing=locked \\
+    rm -f /etc/apt/apt.conf.d/docker-clean \\
+    && apt-get update && apt-get install -y --no-install-recommends \\
+    ca-certificates \\
+    curl \\
+    fonts-liberation \\
+    libasound2 \\
+    libatk-bridge2.0-0 \\
+    libatk1.0-0 \\
+    libatspi2.0-0 \\
+    libcairo2 \\
+    libcups2 \\
+    libdbus-1-3 \\
+    libdrm2 \\
+    libexpat1 \\
+    libgbm1 \\
+    libglib2.0-0 \\
+    libgtk-3-0 \\
+    libnspr4 \\
+    libnss3 \\
+    libpango-1.0-0 \\
+    libvulkan1 \\
+    libx11-6 \\
+    libxcb1 \\
+    libxcomposite1 \\
+    libxdamage1 \\
+    libxext6 \\
+    libxfixes3 \\
+    libxkbcommon0 \\
+    libxrandr2 \\
+    xdg-utils \\
+    && ln -s /opt/google/chrome/chrome /usr/bin/google-chrome
+
+# Copy Chrome, ChromeDriver and the installed Python packages from the build
+# stage; they sit above the application code, so code-only edits reuse these
+# layers
+COPY --from=builder /opt/google/chrome /opt/google/chrome
+COPY --from=builder /usr/local/bin/chromedriver /usr/local/bin/chromedriver
+COPY --from=builder /install /usr/local
 
 # Copy application files
 COPY . .
@@ -70,8 +155,7 @@ HEALTHCHECK CMD curl --fail http://localhost:8501/_stcore/health
 CMD ["streamlit", "run", "main.py", "--server.port=8501", "--server.address=0.0.0.0"]
 '''
 
-with open('Dockerfile', 'w') as f:
-    f.write(dockerfile_content)
+write_if_changed('Dockerfile', dockerfile_content)
 
 # 3. Create docker-compose.yml for local development
 docker_compose_content = '''version: '3.8'
@@ -95,8 +179,7 @@ services:
       start_period: 60s
 '''
 
-with open('docker-compose.yml', 'w') as f:
-    f.write(docker_compose_content)
+write_if_changed('docker-compose.yml', docker_compose_content)
 
 # 4. Create deployment script
 deployment_script = '''#!/bin/bash
@@ -108,8 +191,34 @@ echo "===================================="
 if [ "$1" = "local" ]; then
     echo "📦 Building and running locally with Docker..."
     
-    # Build the Docker image
-    docker build -t vahan-dashboard .
+    # Lock the dependency set (with hashes) for the image's Python 3.9 when uv
+    # is available; without a lock the image installs from requirements.txt
+    if command -v uv >/dev/null 2>&1; then
+        if [ ! -f requirements.lock ] || [ requirements.txt -nt requirements.lock ]; then
+            echo "🔒 Locking requirements..."
+            uv pip compile --generate-hashes --python-version 3.9 --python-platform linux \\
+                -o requirements.lock requirements.txt || exit 1
+        fi
+    elif [ -f requirements.lock ] && [ requirements.txt -nt requirements.lock ]; then
+        echo "❌ requirements.lock is older than requirements.txt; install uv to relock it or delete it"
+        exit 1
+    fi
+    
+    # Layer cache shared through a registry, so any machine or CI runner can
+    # reuse every stage's layers (override with VAHAN_CACHE_REF)
+    CACHE_REF="${VAHAN_CACHE_REF:-ghcr.io/${USER}/vahan-cache}"
+    
+    # Registry cache export needs a docker-container builder
+    docker buildx create --use --name vahan-builder 2>/dev/null || docker buildx use vahan-builder
+    
+    # Build the Docker image with BuildKit, importing and exporting the full
+    # (mode=max) layer cache; a failed cache push does not fail the build, and
+    # --load puts the image in the local engine for docker run
+    docker buildx build \\
+        --cache-from=type=registry,ref="$CACHE_REF" \\
+        --cache-to=type=registry,ref="$CACHE_REF",mode=max,ignore-error=true \\
+        --load \\
+        -t vahan-dashboard:latest .
     
     # Run the container
     docker run -d \\
@@ -170,8 +279,7 @@ else
 fi
 '''
 
-with open('deploy.sh', 'w') as f:
-    f.write(deployment_script)
+write_if_changed('deploy.sh', deployment_script)
 
 # Make deployment script executable
 os.chmod('deploy.sh', 0o755)
@@ -224,8 +332,7 @@ echo "To run with Docker:"
 echo "  ./deploy.sh local"
 '''
 
-with open('setup.sh', 'w') as f:
-    f.write(setup_script)
+write_if_changed('setup.sh', setup_script)
 
 # Make setup script executable
 os.chmod('setup.sh', 0o755)
@@ -282,8 +389,33 @@ dist/
 *.egg-info/
 '''
 
-with open('.gitignore', 'w') as f:
-    f.write(gitignore_content)
+write_if_changed('.gitignore', gitignore_content)
+
+# 7. Create .dockerignore so COPY . . only hashes application sources
+dockerignore_content = gitignore_content + '''
+# Docker build context
+.git
+.dockerignore
+Dockerfile
+docker-compose.yml
+*.md
+tests/
+'''
+
+write_if_changed('.dockerignore', dockerignore_content)
+
+# 8. Lock requirements with hashes for the Docker image's Python 3.9 (uv
+# can target another interpreter version; pip-compile only locks for its own)
+import subprocess
+
+lock_command = [
+    'uv', 'pip', 'compile', '--generate-hashes', '--python-version', '3.9',
+    '--python-platform', 'linux', '-o', 'requirements.lock', 'requirements.txt'
+]
+try:
+    lock_created = subprocess.run(lock_command, check=False).returncode == 0
+except FileNotFoundError:
+    lock_created = False
 
 print("Created deployment and configuration files:")
 print("✅ .streamlit/config.toml - Streamlit configuration")
@@ -292,6 +424,11 @@ print("✅ docker-compose.yml - Local Docker setup")
 print("✅ deploy.sh - Deployment automation script")
 print("✅ setup.sh - Environment setup script")
 print("✅ .gitignore - Git ignore patterns")
+print("✅ .dockerignore - Docker build context exclusions")
+if lock_created:
+    print("✅ requirements.lock - Hash-pinned dependencies for Docker")
+else:
+    print("⚠️ requirements.lock not created (install uv); the image installs from requirements.txt until it exists")
 print("\nDeployment options available:")
 print("🐳 Docker: ./deploy.sh local")
 print("☁️ Streamlit Cloud: ./deploy.sh cloud") 
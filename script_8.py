@@ -87,9 +87,9 @@ print("🔧 TECHNICAL STACK:")
 print("-" * 30)
 tech_stack = {
     "Frontend": "Streamlit + Custom CSS",
-    "Visualization": "Plotly Express + Plotly Graph Objects", 
+    "Visualization": "Plotly Graph Objects", 
     "Data Processing": "Pandas + NumPy",
-    "Web Scraping": "Selenium + BeautifulSoup4",
+    "Web Scraping": "Requests + Selenium, lxml via pandas.read_html",
     "Deployment": "Streamlit Cloud / Docker / Heroku",
     "Development": "Python 3.9+",
     "Database": "CSV (expandable to PostgreSQL/MongoDB)",